@@ -32,6 +32,10 @@ d = { 'settings': { 'branch': 'main',
                                                                                                           'cjm_byte_track/byte_tracker.py'),
                                              'cjm_byte_track.byte_tracker.BYTETracker._match_tracks_to_detections': ( 'byte_tracker.html#bytetracker._match_tracks_to_detections',
                                                                                                                       'cjm_byte_track/byte_tracker.py'),
+                                             'cjm_byte_track.byte_tracker.BYTETracker._merge_stracks': ( 'byte_tracker.html#bytetracker._merge_stracks',
+                                                                                                         'cjm_byte_track/byte_tracker.py'),
+                                             'cjm_byte_track.byte_tracker.BYTETracker._predict_strack_pool': ( 'byte_tracker.html#bytetracker._predict_strack_pool',
+                                                                                                               'cjm_byte_track/byte_tracker.py'),
                                              'cjm_byte_track.byte_tracker.BYTETracker._process_output': ( 'byte_tracker.html#bytetracker._process_output',
                                                                                                           'cjm_byte_track/byte_tracker.py'),
                                              'cjm_byte_track.byte_tracker.BYTETracker._scale_bboxes': ( 'byte_tracker.html#bytetracker._scale_bboxes',
@@ -40,8 +44,14 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                   'cjm_byte_track/byte_tracker.py'),
                                              'cjm_byte_track.byte_tracker.BYTETracker._update_tracks': ( 'byte_tracker.html#bytetracker._update_tracks',
                                                                                                          'cjm_byte_track/byte_tracker.py'),
+                                             'cjm_byte_track.byte_tracker.BYTETracker._update_without_detections': ( 'byte_tracker.html#bytetracker._update_without_detections',
+                                                                                                                     'cjm_byte_track/byte_tracker.py'),
                                              'cjm_byte_track.byte_tracker.BYTETracker.update': ( 'byte_tracker.html#bytetracker.update',
                                                                                                  'cjm_byte_track/byte_tracker.py'),
+                                             'cjm_byte_track.byte_tracker.STrackArrays': ( 'byte_tracker.html#strackarrays',
+                                                                                           'cjm_byte_track/byte_tracker.py'),
+                                             'cjm_byte_track.byte_tracker.STrackArrays.from_stracks': ( 'byte_tracker.html#strackarrays.from_stracks',
+                                                                                                        'cjm_byte_track/byte_tracker.py'),
                                              'cjm_byte_track.byte_tracker.joint_stracks': ( 'byte_tracker.html#joint_stracks',
                                                                                             'cjm_byte_track/byte_tracker.py'),
                                              'cjm_byte_track.byte_tracker.remove_duplicate_stracks': ( 'byte_tracker.html#remove_duplicate_stracks',
@@ -107,8 +117,14 @@ d = { 'settings': { 'branch': 'main',
                                                                                                      'cjm_byte_track/kalman_filter.py'),
                                               'cjm_byte_track.kalman_filter.KalmanFilter.update': ( 'kalman_filter.html#kalmanfilter.update',
                                                                                                     'cjm_byte_track/kalman_filter.py')},
-            'cjm_byte_track.matching': { 'cjm_byte_track.matching.box_iou_batch': ( 'matching.html#box_iou_batch',
+            'cjm_byte_track.matching': { 'cjm_byte_track.matching._iou_distance_kernel': ( 'matching.html#_iou_distance_kernel',
+                                                                                           'cjm_byte_track/matching.py'),
+                                         'cjm_byte_track.matching._sparse_linear_assignment': ( 'matching.html#_sparse_linear_assignment',
+                                                                                                'cjm_byte_track/matching.py'),
+                                         'cjm_byte_track.matching.box_iou_batch': ( 'matching.html#box_iou_batch',
                                                                                     'cjm_byte_track/matching.py'),
+                                         'cjm_byte_track.matching.box_iou_distance_batch': ( 'matching.html#box_iou_distance_batch',
+                                                                                             'cjm_byte_track/matching.py'),
                                          'cjm_byte_track.matching.indices_to_matches': ( 'matching.html#indices_to_matches',
                                                                                          'cjm_byte_track/matching.py'),
                                          'cjm_byte_track.matching.iou_distance': ( 'matching.html#iou_distance',
@@ -117,7 +133,8 @@ d = { 'settings': { 'branch': 'main',
                                          'cjm_byte_track.matching.linear_assignment': ( 'matching.html#linear_assignment',
                                                                                         'cjm_byte_track/matching.py'),
                                          'cjm_byte_track.matching.match_detections_with_tracks': ( 'matching.html#match_detections_with_tracks',
-                                                                                                   'cjm_byte_track/matching.py')},
+                                                                                                   'cjm_byte_track/matching.py'),
+                                         'cjm_byte_track.matching.tlbr_array': ('matching.html#tlbr_array', 'cjm_byte_track/matching.py')},
             'cjm_byte_track.strack': { 'cjm_byte_track.strack.STrack': ('strack.html#strack', 'cjm_byte_track/strack.py'),
                                        'cjm_byte_track.strack.STrack.__init__': ('strack.html#strack.__init__', 'cjm_byte_track/strack.py'),
                                        'cjm_byte_track.strack.STrack.__repr__': ('strack.html#strack.__repr__', 'cjm_byte_track/strack.py'),
@@ -129,6 +146,8 @@ d = { 'settings': { 'branch': 'main',
                                        'cjm_byte_track.strack.STrack.predict': ('strack.html#strack.predict', 'cjm_byte_track/strack.py'),
                                        'cjm_byte_track.strack.STrack.re_activate': ( 'strack.html#strack.re_activate',
                                                                                      'cjm_byte_track/strack.py'),
+                                       'cjm_byte_track.strack.STrack.readonly_tlbr': ( 'strack.html#strack.readonly_tlbr',
+                                                                                       'cjm_byte_track/strack.py'),
                                        'cjm_byte_track.strack.STrack.tlbr': ('strack.html#strack.tlbr', 'cjm_byte_track/strack.py'),
                                        'cjm_byte_track.strack.STrack.tlbr_to_tlwh': ( 'strack.html#strack.tlbr_to_tlwh',
                                                                                       'cjm_byte_track/strack.py'),
@@ -137,4 +156,24 @@ d = { 'settings': { 'branch': 'main',
                                                                                       'cjm_byte_track/strack.py'),
                                        'cjm_byte_track.strack.STrack.tlwh_to_xyah': ( 'strack.html#strack.tlwh_to_xyah',
                                                                                       'cjm_byte_track/strack.py'),
-                                       'cjm_byte_track.strack.STrack.update': ('strack.html#strack.update', 'cjm_byte_track/strack.py')}}}
+                                       'cjm_byte_track.strack.STrack.update': ('strack.html#strack.update', 'cjm_byte_track/strack.py')},
+            'cjm_byte_track.tracker_process': { 'cjm_byte_track.tracker_process.BYTETrackerProcess': ( 'tracker_process.html#bytetrackerprocess',
+                                                                                                       'cjm_byte_track/tracker_process.py'),
+                                                'cjm_byte_track.tracker_process.BYTETrackerProcess.__enter__': ( 'tracker_process.html#bytetrackerprocess.__enter__',
+                                                                                                                 'cjm_byte_track/tracker_process.py'),
+                                                'cjm_byte_track.tracker_process.BYTETrackerProcess.__exit__': ( 'tracker_process.html#bytetrackerprocess.__exit__',
+                                                                                                                'cjm_byte_track/tracker_process.py'),
+                                                'cjm_byte_track.tracker_process.BYTETrackerProcess.__init__': ( 'tracker_process.html#bytetrackerprocess.__init__',
+                                                                                                                'cjm_byte_track/tracker_process.py'),
+                                                'cjm_byte_track.tracker_process.BYTETrackerProcess.close': ( 'tracker_process.html#bytetrackerprocess.close',
+                                                                                                             'cjm_byte_track/tracker_process.py'),
+                                                'cjm_byte_track.tracker_process.BYTETrackerProcess.get': ( 'tracker_process.html#bytetrackerprocess.get',
+                                                                                                           'cjm_byte_track/tracker_process.py'),
+                                                'cjm_byte_track.tracker_process.BYTETrackerProcess.submit': ( 'tracker_process.html#bytetrackerprocess.submit',
+                                                                                                              'cjm_byte_track/tracker_process.py'),
+                                                'cjm_byte_track.tracker_process._track_window': ( 'tracker_process.html#_track_window',
+                                                                                                  'cjm_byte_track/tracker_process.py'),
+                                                'cjm_byte_track.tracker_process._tracker_worker': ( 'tracker_process.html#_tracker_worker',
+                                                                                                    'cjm_byte_track/tracker_process.py'),
+                                                'cjm_byte_track.tracker_process.track_windows': ( 'tracker_process.html#track_windows',
+                                                                                                  'cjm_byte_track/tracker_process.py')}}}
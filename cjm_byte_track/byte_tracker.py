@@ -1,16 +1,43 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/00_byte_tracker.ipynb.
 
 # %% auto 0
-__all__ = ['BYTETracker', 'joint_stracks', 'sub_stracks', 'remove_duplicate_stracks']
+__all__ = ['STrackArrays', 'BYTETracker', 'joint_stracks', 'sub_stracks', 'remove_duplicate_stracks']
 
 # %% ../nbs/00_byte_tracker.ipynb 3
+from dataclasses import dataclass
 import numpy as np
 from .strack import STrack
 from .kalman_filter import KalmanFilter
 from .matching import iou_distance, linear_assignment
 from .basetrack import BaseTrack, TrackState
 
-# %% ../nbs/00_byte_tracker.ipynb 5
+# %% ../nbs/00_byte_tracker.ipynb 4
+@dataclass
+class STrackArrays:
+    """
+    Parallel arrays holding the track attributes used for matching, so they are read from each track only once.
+    """
+    tlbrs:np.ndarray # Bounding boxes in tlbr format, shape (N, 4), float32.
+    is_tracked:np.ndarray # Whether each track is in Tracked state, shape (N,).
+    ages:np.ndarray # Number of frames since each track started (frame_id - start_frame), shape (N,).
+
+    @classmethod
+    def from_stracks(cls, 
+                     stracks:list # List of tracks.
+                    ) -> 'STrackArrays': # The track attributes as parallel arrays.
+        """
+        Gather the attributes of a list of tracks in a single pass.
+        """
+        tlbrs = np.empty((len(stracks), 4), dtype=np.float32)
+        is_tracked = np.empty(len(stracks), dtype=bool)
+        ages = np.empty(len(stracks), dtype=np.int64)
+        for i, track in enumerate(stracks):
+            tlbrs[i] = track.readonly_tlbr
+            is_tracked[i] = track.state == TrackState.Tracked
+            ages[i] = track.frame_id - track.start_frame
+        return cls(tlbrs, is_tracked, ages)
+
+# %% ../nbs/00_byte_tracker.ipynb 7
 class BYTETracker:
     """
     BYTETracker is a class for tracking objects in video streams using bounding box detections, with methods for processing and updating tracks based on detection results and IoU matching.
@@ -44,9 +71,9 @@ class BYTETracker:
         # Initialize Kalman filter
         self.kalman_filter = KalmanFilter()
         
-        # Lists to store different kinds of tracks
-        self.tracked_stracks = []
-        self.lost_stracks = []
+        # Tracked and lost tracks are stored in dictionaries keyed by track_id, removed tracks in a list
+        self.tracked_stracks = {}
+        self.lost_stracks = {}
         self.removed_stracks = []
         
         BaseTrack._count = 0
@@ -99,12 +126,24 @@ class BYTETracker:
         Update the list of tracked and unconfirmed tracks.
         """
 
-        unconfirmed = [track for track in self.tracked_stracks if not track.is_activated]
-        tracked_stracks = [track for track in self.tracked_stracks if track.is_activated]
+        unconfirmed = [track for track in self.tracked_stracks.values() if not track.is_activated]
+        tracked_stracks = [track for track in self.tracked_stracks.values() if track.is_activated]
         return unconfirmed, tracked_stracks
 
+    def _predict_strack_pool(self
+                            ) -> tuple: # List of unconfirmed tracks and the predicted pool of tracked and lost tracks.
+        """
+        Pool the tracked tracks with the lost tracks and predict their current states.
+        """
+
+        # Skip lost tracks whose id is already in the tracked dictionary
+        unconfirmed, tracked_stracks = self._update_tracked_stracks()
+        strack_pool = tracked_stracks + [track for track in self.lost_stracks.values() if track.track_id not in self.tracked_stracks]
+        STrack.multi_predict(strack_pool)
+        return unconfirmed, strack_pool
+
     def _match_tracks_to_detections(self, 
-                                    stracks:list, # List of tracks.
+                                    stracks, # List of tracks, or an (N, 4) array of their bounding boxes in tlbr format.
                                     detections:list, # List of detections.
                                     thresh:float # IOU threshold for matching.
                                    ) -> tuple: # Matches and unmatched tracks and detections.
@@ -149,23 +188,33 @@ class BYTETracker:
         refind_stracks, activated_stracks, lost_stracks, removed_stracks = [], [], [], []
 
         scores, bboxes = self._process_output(output_results)
+
+        # Split detections into high and low confidence sets (each mask is computed once)
+        high_mask = scores > self.track_thresh
+        low_mask = (scores > 0.1) & (scores < self.track_thresh)
+
+        # Skip detection handling and matching when neither set has any detections
+        if not (high_mask.any() or low_mask.any()):
+            return self._update_without_detections()
+
         bboxes = self._scale_bboxes(img_info, img_size, bboxes)
-        detections = self._get_detections(bboxes[scores > self.track_thresh], scores[scores > self.track_thresh])
-        detections_second = self._get_detections(bboxes[np.logical_and(scores > 0.1, scores < self.track_thresh)], 
-                                                 scores[np.logical_and(scores > 0.1, scores < self.track_thresh)])
+        detections = self._get_detections(bboxes[high_mask], scores[high_mask])
+        detections_second = self._get_detections(bboxes[low_mask], scores[low_mask])
 
-        # Update tracked stracks
-        unconfirmed, tracked_stracks = self._update_tracked_stracks()
-        strack_pool = joint_stracks(tracked_stracks, self.lost_stracks)
-        STrack.multi_predict(strack_pool)
+        # Update tracked stracks, pool them with the lost tracks and predict their states
+        unconfirmed, strack_pool = self._predict_strack_pool()
+
+        # Read the predicted boxes and states of the pooled tracks once
+        pool_arrays = STrackArrays.from_stracks(strack_pool)
 
         # Match and update tracks
-        matches, u_track, u_detection = self._match_tracks_to_detections(strack_pool, detections, self.match_thresh)
+        matches, u_track, u_detection = self._match_tracks_to_detections(pool_arrays.tlbrs, detections, self.match_thresh)
         self._update_tracks(strack_pool, detections, matches, refind_stracks, activated_stracks)
 
-        # Additional matching and track updates
-        r_tracked_stracks = [strack_pool[i] for i in u_track if strack_pool[i].state == TrackState.Tracked]
-        matches, u_track, _ = self._match_tracks_to_detections(r_tracked_stracks, detections_second, thresh=0.5)
+        # Additional matching and track updates (unmatched tracks keep their box and state through the first matching)
+        r_tracked_indices = u_track[pool_arrays.is_tracked[u_track]]
+        r_tracked_stracks = [strack_pool[i] for i in r_tracked_indices]
+        matches, u_track, _ = self._match_tracks_to_detections(pool_arrays.tlbrs[r_tracked_indices], detections_second, thresh=0.5)
         self._update_tracks(r_tracked_stracks, detections_second, matches, refind_stracks, activated_stracks)
         for it in u_track:
             track = r_tracked_stracks[it]
@@ -191,78 +240,130 @@ class BYTETracker:
                 track.activate(self.kalman_filter, self.frame_id)
                 activated_stracks.append(track)
 
+        return self._merge_stracks(activated_stracks, refind_stracks, lost_stracks, removed_stracks)
+
+    def _update_without_detections(self
+                                  ) -> list: # List of activated tracks.
+        """
+        Update the tracker for a frame without any usable detections.
+        """
+
+        # Pool and predict the existing tracks as usual
+        unconfirmed, strack_pool = self._predict_strack_pool()
+
+        # No track can be matched, so tracked tracks become lost and unconfirmed tracks are removed
+        lost_stracks = [track for track in strack_pool if track.state == TrackState.Tracked]
+        for track in lost_stracks:
+            track.mark_lost()
+        for track in unconfirmed:
+            track.mark_removed()
+
+        return self._merge_stracks([], [], lost_stracks, unconfirmed)
+
+    def _merge_stracks(self, 
+                       activated_stracks:list, # Tracks activated in the current frame.
+                       refind_stracks:list, # Tracks refound in the current frame.
+                       lost_stracks:list, # Tracks lost in the current frame.
+                       removed_stracks:list # Tracks removed in the current frame.
+                      ) -> list: # List of activated tracks.
+        """
+        Merge the results of the current frame into the tracker's track collections.
+        """
+
         # Handle lost and removed tracks
-        for track in self.lost_stracks:
+        for track in self.lost_stracks.values():
             if self.frame_id - track.end_frame > self.max_time_lost:
                 track.mark_removed()
                 removed_stracks.append(track)
 
-        removed_stracks.extend([track for track in self.lost_stracks if self.frame_id - track.end_frame > self.max_time_lost])
-        self.tracked_stracks = [t for t in self.tracked_stracks if t.state == TrackState.Tracked]
+        # Only tracks marked lost or removed during this update can have left the Tracked state
+        for track in lost_stracks + removed_stracks:
+            self.tracked_stracks.pop(track.track_id, None)
         self.tracked_stracks = joint_stracks(self.tracked_stracks, activated_stracks)
         self.tracked_stracks = joint_stracks(self.tracked_stracks, refind_stracks)
         self.lost_stracks = sub_stracks(self.lost_stracks, self.tracked_stracks)
-        self.lost_stracks.extend(lost_stracks)
+        self.lost_stracks.update((track.track_id, track) for track in lost_stracks)
         self.lost_stracks = sub_stracks(self.lost_stracks, self.removed_stracks)
         self.removed_stracks.extend(removed_stracks)
         self.tracked_stracks, self.lost_stracks = remove_duplicate_stracks(self.tracked_stracks, self.lost_stracks)
-        return [track for track in self.tracked_stracks if track.is_activated]
+        return [track for track in self.tracked_stracks.values() if track.is_activated]
 
-# %% ../nbs/00_byte_tracker.ipynb 15
-def joint_stracks(track_list_a:list, # The first list of tracks.
-                  track_list_b:list # The second list of tracks.
-                 ) -> list: # A combined list of unique tracks.
+# %% ../nbs/00_byte_tracker.ipynb 20
+def joint_stracks(track_list_a, # The first collection of tracks (a list or a dictionary keyed by track_id).
+                  track_list_b # The second collection of tracks (a list or a dictionary keyed by track_id).
+                 ): # A combined collection of unique tracks, of the same type as track_list_a.
     """
-    Combines two lists of tracks ensuring each track is unique based on its track_id.
+    Combines two collections of tracks ensuring each track is unique based on its track_id.
     """
-    # Using a dictionary comprehension to ensure unique tracks based on track_id
-    unique_tracks = {track.track_id: track for track in track_list_a + track_list_b}
+    # Copy the first collection into a dictionary keyed by track_id
+    if isinstance(track_list_a, dict):
+        unique_tracks = dict(track_list_a)
+    else:
+        unique_tracks = {track.track_id: track for track in track_list_a}
+    
+    # Add the tracks from the second collection whose track_id has not been seen yet
+    tracks_b = track_list_b.values() if isinstance(track_list_b, dict) else track_list_b
+    for track in tracks_b:
+        if track.track_id not in unique_tracks:
+            unique_tracks[track.track_id] = track
     
-    return list(unique_tracks.values())
+    # Return a list when given lists, so only the tracker's dictionary-based state gets dictionaries
+    return unique_tracks if isinstance(track_list_a, dict) else list(unique_tracks.values())
 
-# %% ../nbs/00_byte_tracker.ipynb 16
-def sub_stracks(track_list_a:list, # The list of tracks to subtract from.
-                track_list_b:list # The list of tracks to subtract.
-               ) -> list: # A list containing tracks from track_list_a that are not in track_list_b.
+# %% ../nbs/00_byte_tracker.ipynb 21
+def sub_stracks(track_list_a, # The collection of tracks to subtract from (a list or a dictionary keyed by track_id).
+                track_list_b # The collection of tracks to subtract (a list or a dictionary keyed by track_id).
+               ): # The tracks from track_list_a that are not in track_list_b, of the same type as track_list_a.
     """
     Subtracts the tracks in track_list_b from track_list_a based on track_id.
     """
-    # Creating a set of track_ids from track_list_b for efficient look-up
-    track_ids_b = {track.track_id for track in track_list_b}
+    # Dictionary keys already support efficient look-up, otherwise create a set of track_ids from track_list_b
+    track_ids_b = track_list_b if isinstance(track_list_b, dict) else {track.track_id for track in track_list_b}
     
     # Return tracks from track_list_a that are not in track_list_b based on track_id
+    if isinstance(track_list_a, dict):
+        return {track_id: track for track_id, track in track_list_a.items() if track_id not in track_ids_b}
     return [track for track in track_list_a if track.track_id not in track_ids_b]
 
-# %% ../nbs/00_byte_tracker.ipynb 17
-def remove_duplicate_stracks(s_tracks_a:list, # The first list of tracks.
-                             s_tracks_b:list # The second list of tracks.
-                            ) -> tuple: # Two lists of tracks with duplicates removed.
+# %% ../nbs/00_byte_tracker.ipynb 22
+def remove_duplicate_stracks(s_tracks_a, # The first collection of tracks (a list or a dictionary keyed by track_id).
+                             s_tracks_b # The second collection of tracks (a list or a dictionary keyed by track_id).
+                            ) -> tuple: # Two collections of tracks, of the same type as the inputs, with duplicates removed.
     """
-    Removes duplicate tracks from two lists based on a defined distance metric and time criteria. 
+    Removes duplicate tracks from two collections based on a defined distance metric and time criteria. 
     """
+    # Work on lists of tracks and convert each result back to a dictionary if its input was one
+    a_is_dict, b_is_dict = isinstance(s_tracks_a, dict), isinstance(s_tracks_b, dict)
+    if a_is_dict:
+        s_tracks_a = list(s_tracks_a.values())
+    if b_is_dict:
+        s_tracks_b = list(s_tracks_b.values())
+    
+    # Read the boxes and ages of the tracks once
+    arrays_a, arrays_b = STrackArrays.from_stracks(s_tracks_a), STrackArrays.from_stracks(s_tracks_b)
+    
     # Calculate pairwise distance between tracks in the two lists
-    pairwise_distance = iou_distance(s_tracks_a, s_tracks_b)
+    pairwise_distance = iou_distance(arrays_a.tlbrs, arrays_b.tlbrs)
     
     # Identify pairs of tracks with distance less than 0.15 (indicating potential duplicates)
-    pairs = np.where(pairwise_distance < 0.15)
+    pairs_a, pairs_b = np.where(pairwise_distance < 0.15)
 
     # Sets to store indexes of duplicate tracks in each list
     duplicates_a, duplicates_b = set(), set()
     
-    for track_a_index, track_b_index in zip(*pairs):
-        # Calculate how long each track has been in the list
-        time_a = s_tracks_a[track_a_index].frame_id - s_tracks_a[track_a_index].start_frame
-        time_b = s_tracks_b[track_b_index].frame_id - s_tracks_b[track_b_index].start_frame
-        
-        # Compare times and add the newer track to the duplicate set
-        if time_a > time_b:
-            duplicates_b.add(track_b_index)
-        else:
-            duplicates_a.add(track_a_index)
+    if pairs_a.size:
+        # Compare how long each track has been in the list and add the newer track of each pair to the duplicate set
+        a_is_older = arrays_a.ages[pairs_a] > arrays_b.ages[pairs_b]
+        duplicates_b = set(pairs_b[a_is_older].tolist())
+        duplicates_a = set(pairs_a[~a_is_older].tolist())
 
     # Filter out duplicates from the original lists
     result_a = [track for i, track in enumerate(s_tracks_a) if i not in duplicates_a]
     result_b = [track for i, track in enumerate(s_tracks_b) if i not in duplicates_b]
     
+    if a_is_dict:
+        result_a = {track.track_id: track for track in result_a}
+    if b_is_dict:
+        result_b = {track.track_id: track for track in result_b}
     return result_a, result_b
 
@@ -92,7 +92,10 @@ class KalmanFilter:
         """
         Run the Kalman filter prediction step for multiple measurements (Vectorized version).
         """
-        motion_cov = np.array([np.diag(s) for s in self._create_std(mean)**2])
+        # Place the squared standard deviations on the diagonal of each (8, 8) motion covariance
+        motion_cov = np.zeros(covariance.shape)
+        diag = np.arange(2 * self.ndim)
+        motion_cov[:, diag, diag] = self._create_std(mean)**2
 
         mean = mean @ self._motion_mat.T
         covariance = self._motion_mat @ covariance @ self._motion_mat.T[np.newaxis, ...] + motion_cov
@@ -1,12 +1,20 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/04_matching.ipynb.
 
 # %% auto 0
-__all__ = ['box_iou_batch', 'indices_to_matches', 'linear_assignment', 'ious', 'iou_distance', 'match_detections_with_tracks']
+__all__ = ['box_iou_batch', 'box_iou_distance_batch', 'indices_to_matches', 'linear_assignment', 'ious', 'tlbr_array',
+           'iou_distance', 'match_detections_with_tracks']
 
 # %% ../nbs/04_matching.ipynb 3
 from typing import List
 import numpy as np
 from scipy.optimize import linear_sum_assignment
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import min_weight_full_bipartite_matching
+
+try:
+    import numba
+except ImportError:
+    numba = None
 
 from .strack import STrack
 
@@ -17,56 +25,156 @@ def box_iou_batch(boxes_true:np.ndarray, # Ground truth bounding boxes, shape (N
     """
     Compute the Intersection over Union (IoU) between two sets of bounding boxes.
     """
+    # Split the boxes into per-coordinate columns
+    xa1, ya1, xa2, ya2 = boxes_true.T
+    xb1, yb1, xb2, yb2 = boxes_detection.T
+
     # Compute areas of the true boxes and detected boxes
-    area_true = (boxes_true[:, 2] - boxes_true[:, 0]) * (boxes_true[:, 3] - boxes_true[:, 1])
-    area_detection = (boxes_detection[:, 2] - boxes_detection[:, 0]) * (boxes_detection[:, 3] - boxes_detection[:, 1])
+    area_true = (xa2 - xa1) * (ya2 - ya1)
+    area_detection = (xb2 - xb1) * (yb2 - yb1)
 
-    # Find the top left and bottom right coordinates for the intersections
-    top_left = np.maximum(boxes_true[:, None, :2], boxes_detection[:, :2])
-    bottom_right = np.minimum(boxes_true[:, None, 2:], boxes_detection[:, 2:])
+    # Compute intersection widths and heights as (N, M) arrays, clipped at zero
+    inter_w = np.minimum(xa2[:, None], xb2) - np.maximum(xa1[:, None], xb1)
+    np.maximum(inter_w, 0, out=inter_w)
+    inter_h = np.minimum(ya2[:, None], yb2) - np.maximum(ya1[:, None], yb1)
+    np.maximum(inter_h, 0, out=inter_h)
 
-    # Compute intersection areas
-    area_inter = np.prod(np.maximum(bottom_right - top_left, 0), axis=2)
+    # Compute intersection areas (reusing the width buffer)
+    area_inter = np.multiply(inter_w, inter_h, out=inter_w)
 
     # Compute IoU values for each pair of boxes
     return area_inter / (area_true[:, None] + area_detection - area_inter)
 
 # %% ../nbs/04_matching.ipynb 5
+def _iou_distance_kernel(boxes_true:np.ndarray, # Ground truth bounding boxes, shape (N, 4) format (x_min, y_min, x_max, y_max).
+                         boxes_detection:np.ndarray, # Detected bounding boxes, shape (M, 4), format (x_min, y_min, x_max, y_max).
+                         out:np.ndarray # Output array of shape (N, M) for the IoU distances.
+                        ):
+    """
+    Fill `out` with the IoU distance (1 - IoU) between every pair of boxes in a single pass.
+    """
+    for i in range(boxes_true.shape[0]):
+        area_true = (boxes_true[i, 2] - boxes_true[i, 0]) * (boxes_true[i, 3] - boxes_true[i, 1])
+        for j in range(boxes_detection.shape[0]):
+            area_detection = (boxes_detection[j, 2] - boxes_detection[j, 0]) * (boxes_detection[j, 3] - boxes_detection[j, 1])
+            inter_w = max(min(boxes_true[i, 2], boxes_detection[j, 2]) - max(boxes_true[i, 0], boxes_detection[j, 0]), 0.0)
+            inter_h = max(min(boxes_true[i, 3], boxes_detection[j, 3]) - max(boxes_true[i, 1], boxes_detection[j, 1]), 0.0)
+            area_inter = inter_w * inter_h
+            out[i, j] = 1.0 - area_inter / (area_true + area_detection - area_inter)
+
+# Compile the kernel when Numba is available
+if numba is not None:
+    # Use NumPy division semantics so degenerate boxes give NaN instead of raising ZeroDivisionError
+    _iou_distance_kernel = numba.njit(cache=True, error_model='numpy')(_iou_distance_kernel)
+
+# %% ../nbs/04_matching.ipynb 6
+def box_iou_distance_batch(boxes_true:np.ndarray, # Ground truth bounding boxes, shape (N, 4) format (x_min, y_min, x_max, y_max).
+                           boxes_detection:np.ndarray # Detected bounding boxes, shape (M, 4), format (x_min, y_min, x_max, y_max).
+                          ) -> np.ndarray: # Cost matrix of shape (N, M) where each element (i, j) is 1 minus the IoU between boxes_true[i] and boxes_detection[j].
+    """
+    Compute the IoU distance (1 - IoU) between two sets of bounding boxes.
+    """
+    # Use the compiled single-pass kernel when Numba is available
+    if numba is not None:
+        # Keep float32 inputs in float32, matching the dtype the NumPy path would produce
+        dtype = np.result_type(boxes_true.dtype, boxes_detection.dtype, np.float32)
+        cost_matrix = np.empty((len(boxes_true), len(boxes_detection)), dtype=dtype)
+        _iou_distance_kernel(np.ascontiguousarray(boxes_true, dtype=dtype),
+                             np.ascontiguousarray(boxes_detection, dtype=dtype),
+                             cost_matrix)
+        return cost_matrix
+
+    # Subtract from one in place to avoid allocating a second (N, M) matrix
+    iou = box_iou_batch(boxes_true, boxes_detection)
+    return np.subtract(1.0, iou, out=iou)
+
+# %% ../nbs/04_matching.ipynb 7
 def indices_to_matches(cost_matrix:np.ndarray, # The matrix of costs.
-                        indices:tuple, # Indices of potential matches.
-                        thresh:float # Threshold for valid matches.
-                       ) -> tuple: # Contains three elements: Matched indices., Unmatched indices from the first set. Unmatched indices from the second set.
+                       row_ind:np.ndarray, # Row indices of potential matches.
+                       col_ind:np.ndarray, # Column indices of potential matches.
+                       thresh:float # Threshold for valid matches.
+                      ) -> tuple: # Contains three elements: Matched indices., Unmatched indices from the first set. Unmatched indices from the second set.
     """
     Extract matched and unmatched indices based on a threshold.
     """
-    indices_array = np.array(indices)
-    matched_mask = cost_matrix[tuple(indices_array.T)] <= thresh
+    matched_mask = cost_matrix[row_ind, col_ind] <= thresh
+    matched_rows = row_ind[matched_mask]
+    matched_cols = col_ind[matched_mask]
 
-    matches = indices_array[matched_mask]
-    unmatched_a = tuple(np.setdiff1d(np.arange(cost_matrix.shape[0]), matches[:, 0]))
-    unmatched_b = tuple(np.setdiff1d(np.arange(cost_matrix.shape[1]), matches[:, 1]))
+    # Flag matched rows and columns with boolean masks instead of sorting set differences
+    unmatched_mask_a = np.ones(cost_matrix.shape[0], dtype=bool)
+    unmatched_mask_b = np.ones(cost_matrix.shape[1], dtype=bool)
+    unmatched_mask_a[matched_rows] = False
+    unmatched_mask_b[matched_cols] = False
+    unmatched_a = np.flatnonzero(unmatched_mask_a)
+    unmatched_b = np.flatnonzero(unmatched_mask_b)
+
+    # Pair up the matched indices only once the final matches are known
+    matches = np.stack((matched_rows, matched_cols), axis=1)
 
     return matches, unmatched_a, unmatched_b
 
-# %% ../nbs/04_matching.ipynb 6
+# %% ../nbs/04_matching.ipynb 8
+def _sparse_linear_assignment(cost_matrix:np.ndarray, # The matrix of costs.
+                              valid:np.ndarray, # Boolean mask of the costs that are within the threshold.
+                              thresh:float # Threshold for valid matches.
+                             ) -> tuple: # Row indices and column indices of the optimal assignment.
+    """
+    Solve the thresholded assignment problem on a sparse graph containing only the valid pairs.
+    """
+    n_rows, n_cols = cost_matrix.shape
+    rows, cols = np.nonzero(valid)
+    
+    # Give each row a dummy column with the above-threshold cost, so a full matching always exists
+    dummies = np.arange(n_rows)
+    weights = np.concatenate([cost_matrix[rows, cols], np.full(n_rows, thresh + 1e-4)])
+    
+    # Offset every weight by one so zero costs are not dropped as missing edges
+    graph = csr_matrix((weights + 1, (np.concatenate([rows, dummies]), np.concatenate([cols, n_cols + dummies]))), 
+                       shape=(n_rows, n_cols + n_rows))
+    row_ind, col_ind = min_weight_full_bipartite_matching(graph)
+    
+    # Drop the rows assigned to their dummy column
+    real = col_ind < n_cols
+    return row_ind[real], col_ind[real]
+
+# %% ../nbs/04_matching.ipynb 9
 def linear_assignment(cost_matrix:np.ndarray, # The matrix of costs.
                       thresh:float # Threshold for valid matches.
                      ) -> tuple: # Contains three elements: Matched indices, Unmatched indices from the first set., Unmatched indices from the second set.
     """
     Perform linear assignment to minimize the total cost.
     """
-    if not cost_matrix.size:
-        return (np.empty((0, 2), dtype=int), 
-                tuple(range(cost_matrix.shape[0])), 
-                tuple(range(cost_matrix.shape[1])))
-    
+    valid = cost_matrix <= thresh
+
+    # No pair is under the threshold, so nothing can be matched
+    if not valid.any():
+        return (np.empty((0, 2), dtype=int),
+                np.arange(cost_matrix.shape[0]),
+                np.arange(cost_matrix.shape[1]))
+
+    # Only one row or one column has valid pairs, so its cheapest pair is the optimal assignment
+    valid_rows = np.flatnonzero(valid.any(axis=1))
+    if valid_rows.size == 1:
+        row = valid_rows[0]
+        return indices_to_matches(cost_matrix, np.array([row]), np.array([np.argmin(cost_matrix[row])]), thresh)
+    valid_cols = np.flatnonzero(valid.any(axis=0))
+    if valid_cols.size == 1:
+        col = valid_cols[0]
+        return indices_to_matches(cost_matrix, np.array([np.argmin(cost_matrix[:, col])]), np.array([col]), thresh)
+
+    # Solve large problems with few valid pairs on a sparse graph of those pairs
+    if sum(cost_matrix.shape) > 400 and valid.mean() < 0.02:
+        row_ind, col_ind = _sparse_linear_assignment(cost_matrix, valid, thresh)
+        return indices_to_matches(cost_matrix, row_ind, col_ind, thresh)
+
     # Replace values above threshold with a high value
-    cost_matrix = np.where(cost_matrix > thresh, thresh + 1e-4, cost_matrix)
+    cost_matrix = np.where(valid, cost_matrix, thresh + 1e-4)
     row_ind, col_ind = linear_sum_assignment(cost_matrix)
     
-    return indices_to_matches(cost_matrix, np.column_stack((row_ind, col_ind)), thresh)
+    return indices_to_matches(cost_matrix, row_ind, col_ind, thresh)
 
-# %% ../nbs/04_matching.ipynb 7
+# %% ../nbs/04_matching.ipynb 11
 def ious(atlbrs, # List of bounding boxes from the first set. 
          btlbrs # List of bounding boxes from the second set.
         ) -> np.ndarray: # IoU matrix.
@@ -74,14 +182,26 @@ def ious(atlbrs, # List of bounding boxes from the first set.
     Compute the IoU between two sets of bounding boxes.
     """
     if not atlbrs or not btlbrs:
-        return np.zeros((len(atlbrs), len(btlbrs)), dtype=float)
+        return np.zeros((len(atlbrs), len(btlbrs)), dtype=np.float32)
 
     return box_iou_batch(
-        np.ascontiguousarray(atlbrs, dtype=float),
-        np.ascontiguousarray(btlbrs, dtype=float)
+        np.ascontiguousarray(atlbrs, dtype=np.float32),
+        np.ascontiguousarray(btlbrs, dtype=np.float32)
     )
 
-# %% ../nbs/04_matching.ipynb 8
+# %% ../nbs/04_matching.ipynb 12
+def tlbr_array(tracks:list # List of objects with a 'tlbr' attribute.
+              ) -> np.ndarray: # float32 array of shape (N, 4) holding the bounding box of each track in tlbr format.
+    """
+    Gather the bounding boxes of a list of tracks into a single contiguous array.
+    """
+    tlbrs = np.empty((len(tracks), 4), dtype=np.float32)
+    for i, track in enumerate(tracks):
+        # Read the cached box of an STrack directly, since it is copied into the array anyway
+        tlbrs[i] = track.readonly_tlbr if isinstance(track, STrack) else track.tlbr
+    return tlbrs
+
+# %% ../nbs/04_matching.ipynb 13
 def iou_distance(
     atracks:list, # List of tracks from the first set. Each track can be an ndarray or an object with a 'tlbr' attribute.
     btracks:list # List of tracks from the second set. Each track can be an ndarray or an object with a 'tlbr' attribute.
@@ -89,20 +209,18 @@ def iou_distance(
     """
     Compute the cost matrix based on IoU for two sets of tracks.
     """
-    # Determine if tracks should be directly used or if 'tlbr' attribute should be extracted
-    should_extract_tlbr = len(atracks) > 0 and not isinstance(atracks[0], np.ndarray)
+    # Every pair has the maximum cost when either set is empty
+    if len(atracks) == 0 or len(btracks) == 0:
+        return np.ones((len(atracks), len(btracks)), dtype=np.float32)
 
-    # Extract 'tlbr' attribute if required
-    atlbrs = [track.tlbr for track in atracks] if should_extract_tlbr else atracks
-    btlbrs = [track.tlbr for track in btracks] if should_extract_tlbr else btracks
+    # Gather bounding boxes into (N, 4) arrays, extracting the 'tlbr' attribute for sets of tracks
+    atlbrs = np.ascontiguousarray(atracks, dtype=np.float32) if isinstance(atracks[0], np.ndarray) else tlbr_array(atracks)
+    btlbrs = np.ascontiguousarray(btracks, dtype=np.float32) if isinstance(btracks[0], np.ndarray) else tlbr_array(btracks)
 
-    # Compute IoU and derive the cost matrix
-    _ious = ious(atlbrs, btlbrs)
-    cost_matrix = 1 - _ious
+    # Compute the IoU-based cost matrix
+    return box_iou_distance_batch(atlbrs, btlbrs)
 
-    return cost_matrix
-
-# %% ../nbs/04_matching.ipynb 9
+# %% ../nbs/04_matching.ipynb 14
 def match_detections_with_tracks(tlbr_boxes: np.ndarray, # An array of detected bounding boxes, represented as [top, left, bottom, right].
                                  track_ids: np.ndarray, # An array of track IDs corresponding to the input bounding boxes.
                                  tracks: List[STrack] # A list of track objects representing the current tracked objects.
@@ -115,18 +233,27 @@ def match_detections_with_tracks(tlbr_boxes: np.ndarray, # An array of detected
     - If a detected bounding box does not match any existing track (i.e., IOU is zero), its corresponding track ID remains unchanged.
     """
     
+    # Nothing to match without both tracks and detections
+    if len(tracks) == 0 or len(tlbr_boxes) == 0:
+        return track_ids
+    
     # Calculate IOU
-    tracks_boxes = np.array([track.tlbr for track in tracks])
-    iou = box_iou_batch(tracks_boxes, tlbr_boxes)
+    tracks_boxes = tlbr_array(tracks)
+    iou = box_iou_batch(tracks_boxes, np.asarray(tlbr_boxes, dtype=np.float32))
     
-    # Get indices with maximum IOU values
+    # Get indices with maximum IOU values and gather those values instead of a second reduction
     track2detection = np.argmax(iou, axis=1)
-    max_iou_values = np.max(iou, axis=1)
+    max_iou_values = np.take_along_axis(iou, track2detection[:, None], axis=1).ravel()
     
-    # Update track_ids where IOU is not zero
+    # Update track_ids where IOU is not zero, working on an array view so plain lists of IDs are accepted
+    ids = np.asarray(track_ids)
     valid_indices = max_iou_values != 0
-    valid_track_indices = np.arange(len(tracks))[valid_indices]
-    for idx in valid_track_indices:
-        track_ids[track2detection[idx]] = tracks[idx].track_id
+    tracks_ids = np.fromiter((track.track_id for track in tracks), dtype=ids.dtype, count=len(tracks))
+    ids[track2detection[valid_indices]] = tracks_ids[valid_indices]
+    
+    # Write the updated IDs back into list inputs so they are still updated in place
+    if isinstance(track_ids, list):
+        track_ids[:] = ids.tolist()
+        return track_ids
     
-    return track_ids
+    return ids
@@ -30,6 +30,9 @@ class STrack(BaseTrack):
         # Mean and covariance of the state
         self.mean, self.covariance = None, None
         
+        # Cached bounding box in tlbr format, cleared whenever the state changes
+        self._tlbr = None
+        
         # Flag to check if the track is activated
         self.is_activated = False
         
@@ -51,6 +54,7 @@ class STrack(BaseTrack):
         
         # Predict the next state using the kalman filter
         self.mean, self.covariance = self.kalman_filter.predict(mean_state, self.covariance)
+        self._tlbr = None
 
     @staticmethod
     def multi_predict(stracks # List of STrack objects.
@@ -61,21 +65,21 @@ class STrack(BaseTrack):
         if not stracks:
             return
 
-        # Extract mean and covariance for each track
-        multi_states = [(st.mean.copy(), st.covariance) for st in stracks]
+        # Stack the mean and covariance of every track into (N, 8) and (N, 8, 8) arrays
+        multi_means = np.array([st.mean for st in stracks])
+        multi_covariances = np.array([st.covariance for st in stracks])
         
-        # For each track, set velocity to 0 if it's not in Tracked state
-        for i, st in enumerate(stracks):
-            if st.state != TrackState.Tracked:
-                multi_states[i][0][7] = 0
+        # Set velocity to 0 for tracks that are not in Tracked state
+        not_tracked = np.fromiter((st.state != TrackState.Tracked for st in stracks), dtype=bool, count=len(stracks))
+        multi_means[not_tracked, 7] = 0
         
-        # Use shared kalman filter for prediction
-        multi_means, multi_covariances = zip(*multi_states)
-        multi_means, multi_covariances = STrack.shared_kalman.multi_predict(np.asarray(multi_means), np.asarray(multi_covariances))
+        # Use shared kalman filter for a single batched prediction
+        multi_means, multi_covariances = STrack.shared_kalman.multi_predict(multi_means, multi_covariances)
 
         # Update each track with the predicted mean and covariance
         for i, st in enumerate(stracks):
             st.mean, st.covariance = multi_means[i], multi_covariances[i]
+            st._tlbr = None
 
     def activate(self, 
                  kalman_filter, # KalmanFilter instance.
@@ -91,6 +95,7 @@ class STrack(BaseTrack):
         
         # Initiate mean and covariance using the kalman filter
         self.mean, self.covariance = self.kalman_filter.initiate(self.tlwh_to_xyah(self._tlwh))
+        self._tlbr = None
         
         self.tracklet_len = 0
         self.state = TrackState.Tracked
@@ -132,6 +137,7 @@ class STrack(BaseTrack):
         
         # Update mean and covariance using the kalman filter
         self.mean, self.covariance = self.kalman_filter.update(self.mean, self.covariance, self.tlwh_to_xyah(new_track.tlwh))
+        self._tlbr = None
         self.state = TrackState.Tracked
         self.is_activated = True
         
@@ -192,7 +198,19 @@ class STrack(BaseTrack):
         """
         Get bounding box in (top-left x, top-left y, bottom-right x, bottom-right y) format.
         """
-        return self.tlwh_to_tlbr(self.tlwh)
+        # Return a copy so callers can modify the box without touching the cache
+        return self.readonly_tlbr.copy()
+
+    @property
+    def readonly_tlbr(self
+                     ): # Read-only bounding box in tlbr format.
+        """
+        Get the bounding box in tlbr format as a read-only array that is computed once and shared until the track state changes.
+        """
+        if self._tlbr is None:
+            self._tlbr = self.tlwh_to_tlbr(self.tlwh)
+            self._tlbr.flags.writeable = False
+        return self._tlbr
 
     def __repr__(self
                 ): # String representation of the track.
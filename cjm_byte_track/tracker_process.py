@@ -0,0 +1,179 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/05_tracker_process.ipynb.
+
+# %% auto 0
+__all__ = ['BYTETrackerProcess', 'track_windows']
+
+# %% ../nbs/05_tracker_process.ipynb 3
+import multiprocessing as mp
+import pickle
+import queue
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import numpy as np
+from .byte_tracker import BYTETracker
+from .matching import iou_distance, linear_assignment
+
+# %% ../nbs/05_tracker_process.ipynb 4
+def _tracker_worker(tracker_kwargs:dict, # Keyword arguments used to create the BYTETracker.
+                    input_queue:mp.Queue, # Queue of pickled (output_results, img_info, img_size) tuples, or None to stop.
+                    output_queue:mp.Queue # Queue receiving the pickled activated tracks (or the raised exception) for each frame.
+                   ):
+    """
+    Process target that owns a BYTETracker and updates it with each submitted frame.
+    """
+    tracker = BYTETracker(**tracker_kwargs)
+    while True:
+        item = input_queue.get()
+        
+        # A None item signals the end of the stream
+        if item is None:
+            break
+        
+        # Pickle the results right away, since the queue's feeder thread would otherwise
+        # serialize the tracks later, after the next update may have changed them.
+        # Exceptions are sent back so the caller can re-raise them instead of waiting forever.
+        try:
+            output_queue.put(pickle.dumps(tracker.update(*pickle.loads(item))))
+        except Exception as e:
+            output_queue.put(pickle.dumps(e))
+
+# %% ../nbs/05_tracker_process.ipynb 5
+class BYTETrackerProcess:
+    """
+    BYTETrackerProcess runs a BYTETracker in a daemon process, allowing the tracker update for one frame to overlap with detection on the next.
+    """
+    def __init__(self, 
+                 track_thresh:float=0.25, # Threshold value for tracking.
+                 track_buffer:int=30, # Size of buffer for tracking.
+                 match_thresh:float=0.8, # Threshold value for matching tracks to detections.
+                 frame_rate:int=30, # Frame rate of the input video stream.
+                 max_pending:int=0 # Maximum number of frames waiting to be tracked (0 means no limit).
+                ):
+        """
+        Initializes the queues and starts the tracker process.
+        """
+        tracker_kwargs = dict(track_thresh=track_thresh, track_buffer=track_buffer, 
+                              match_thresh=match_thresh, frame_rate=frame_rate)
+        
+        # Queues for submitted detections and tracking results
+        self._input_queue = mp.Queue(max_pending)
+        self._output_queue = mp.Queue()
+        
+        # Start the tracker process
+        self._process = mp.Process(target=_tracker_worker, 
+                                   args=(tracker_kwargs, self._input_queue, self._output_queue), 
+                                   daemon=True)
+        self._process.start()
+
+    def submit(self, 
+               output_results, # Detection results.
+               img_info:tuple, # Original height and width of the image.
+               img_size:tuple # Target size.
+              ):
+        """
+        Queue the detections for a frame and return without waiting for the tracker update.
+        """
+        # Pickle right away so changes made to the detection results after submitting have no effect
+        self._input_queue.put(pickle.dumps((output_results, img_info, img_size)))
+
+    def get(self, 
+            timeout:float=None # Maximum number of seconds to wait for the result.
+           ) -> list: # List of activated tracks.
+        """
+        Get the activated tracks for the oldest submitted frame that has not been retrieved yet.
+        """
+        result = pickle.loads(self._output_queue.get(timeout=timeout))
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def close(self):
+        """
+        Stop the tracker process after it finishes the submitted frames.
+        """
+        if self._process.is_alive():
+            self._input_queue.put(None)
+            
+            # Discard unread results while waiting, since the process cannot exit until its output queue is flushed
+            while self._process.is_alive():
+                try:
+                    self._output_queue.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            self._process.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+# %% ../nbs/05_tracker_process.ipynb 12
+def _track_window(tracker_kwargs:dict, # Keyword arguments used to create the BYTETracker.
+                  window_outputs:list, # Detection results for each frame in the window.
+                  img_info:tuple, # Original height and width of the image.
+                  img_size:tuple # Target size.
+                 ) -> list: # Array of shape (K, 6) for each frame, with rows (track_id, x_min, y_min, x_max, y_max, score).
+    """
+    Track one window of frames with a fresh BYTETracker.
+    """
+    tracker = BYTETracker(**tracker_kwargs)
+    results = []
+    for output_results in window_outputs:
+        tracks = tracker.update(output_results, img_info, img_size)
+        
+        # Copy the track states, since the tracks keep changing in later frames
+        frame_results = np.empty((len(tracks), 6), dtype=float)
+        for i, track in enumerate(tracks):
+            frame_results[i, 0] = track.track_id
+            frame_results[i, 1:5] = track.readonly_tlbr
+            frame_results[i, 5] = track.score
+        results.append(frame_results)
+    return results
+
+# %% ../nbs/05_tracker_process.ipynb 13
+def track_windows(all_outputs:list, # Detection results for each frame of the video.
+                  img_info:tuple, # Original height and width of the image.
+                  img_size:tuple, # Target size.
+                  window_size:int=5000, # Number of frames tracked by each worker.
+                  max_workers:int=None, # Maximum number of worker processes (defaults to the number of CPUs).
+                  track_thresh:float=0.25, # Threshold value for tracking.
+                  track_buffer:int=30, # Size of buffer for tracking.
+                  match_thresh:float=0.8, # Threshold value for matching tracks to detections.
+                  frame_rate:int=30 # Frame rate of the input video stream.
+                 ) -> list: # Array of shape (K, 6) for each frame, with rows (track_id, x_min, y_min, x_max, y_max, score).
+    """
+    Track a whole video offline by splitting it into windows that are tracked in parallel, then stitching track IDs across window boundaries.
+
+    Note:
+    - Tracks are only linked across a boundary if they are active in both the last frame of one window and the first frame of the next.
+    """
+    tracker_kwargs = dict(track_thresh=track_thresh, track_buffer=track_buffer, 
+                          match_thresh=match_thresh, frame_rate=frame_rate)
+    
+    # Track each window in its own process
+    windows = [all_outputs[i:i + window_size] for i in range(0, len(all_outputs), window_size)]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        window_results = list(executor.map(_track_window, repeat(tracker_kwargs), windows, repeat(img_info), repeat(img_size)))
+    
+    results = []
+    next_id = 1
+    prev_last = np.empty((0, 6))
+    for window in window_results:
+        # Link tracks in the first frame of this window to tracks in the last frame of the previous one
+        id_map = {}
+        dists = iou_distance(prev_last[:, 1:5], window[0][:, 1:5])
+        matches, _, _ = linear_assignment(dists, thresh=match_thresh)
+        for iprev, ifirst in matches:
+            id_map[window[0][ifirst, 0]] = prev_last[iprev, 0]
+        
+        # Give every other track in the window a new global ID
+        for frame_results in window:
+            for local_id in frame_results[:, 0]:
+                if local_id not in id_map:
+                    id_map[local_id] = next_id
+                    next_id += 1
+            frame_results[:, 0] = [id_map[local_id] for local_id in frame_results[:, 0]]
+            results.append(frame_results)
+        prev_last = window[-1]
+    return results